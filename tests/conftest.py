@@ -0,0 +1,5 @@
+# Testy importują moduły z katalogu głównego repo (bez pakietu / instalacji)
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
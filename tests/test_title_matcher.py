@@ -0,0 +1,224 @@
+# Testy title_matcher.match_title na sztucznym subreddicie (bez sieci / PRAW).
+# Oczekiwane wyniki = zachowanie wersji sprzed przepisania matchera (pełne sortowanie
+# po (score, created_utc) malejąco, stabilne), z wyjątkiem kontraktu z chunk14-9:
+# best/top zawierają tylko kandydatów z wynikiem ≥ title_threshold_border − 5.
+
+import time
+
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+import title_matcher
+
+NOW = time.time()
+HOUR = 3600.0
+LINK_REQUEST = "📌 Link Request"
+
+
+class _Author:
+    def __init__(self, name):
+        self.name = name
+
+
+class _Submission:
+    def __init__(self, pid, title, author=None, age=HOUR, flair=LINK_REQUEST):
+        self.id = pid
+        self.title = title
+        self.author = _Author(author) if author else None
+        self.link_flair_text = flair
+        self.created_utc = NOW - age
+        self.permalink = f"/r/CShortDramas/comments/{pid}/x/"
+
+
+class _Mod:
+    def __init__(self, queue):
+        self._queue = queue
+
+    def modqueue(self, limit=None):
+        return iter(self._queue[:limit])
+
+
+class _Subreddit:
+    def __init__(self, posts, queue):
+        self._posts = posts
+        self.mod = _Mod(queue)
+
+    def new(self, limit=None):
+        return iter(self._posts[:limit])
+
+
+class _Reddit:
+    def __init__(self, posts, queue=()):
+        self._sub = _Subreddit(list(posts), list(queue))
+
+    def subreddit(self, name):
+        return self._sub
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    title_matcher.cache_clear()
+    title_matcher._POOL_CACHE.clear()
+    yield
+    title_matcher._POOL_CACHE.clear()
+
+
+def _match(title, posts, author="alice", queue=(), **kw):
+    return title_matcher.match_title(
+        title_raw=title,
+        author_name=author,
+        subreddit="CShortDramas",
+        reddit=_Reddit(posts, queue),
+        config=None,
+        **kw,
+    )
+
+
+def _ids(entries):
+    return [e["candidate"]["permalink"].split("/")[4] for e in entries]
+
+
+def test_ranking_by_score_then_newest_regardless_of_match_type():
+    posts = [
+        _Submission("fates", "Love Beyond Fates", "bob", age=1 * HOUR),      # fuzzy 96
+        _Submission("exact", "love, beyond FATE!", "bob", age=5 * HOUR),     # normalized_exact
+        _Submission("loving", "Loving Beyond Fate", "bob", age=2 * HOUR),    # fuzzy 88
+        _Submission("other", "Secret Wife of the CEO", "bob", age=1 * HOUR), # < cutoff
+        _Submission("the", "Love Beyond the Fate", "bob", age=3 * HOUR),     # fuzzy 100
+    ]
+    rep = _match("Love Beyond Fate", posts)
+
+    # remis na 100: nowszy wygrywa, także fuzzy nad normalized_exact
+    assert _ids(rep["top"]) == ["the", "exact", "fates"]
+    assert [e["score"] for e in rep["top"]] == [100, 100, 96]
+    assert [e["type"] for e in rep["top"]] == ["fuzzy", "normalized_exact", "fuzzy"]
+    assert rep["best"] is rep["top"][0]
+    assert rep["pool_ids"] == ["fates", "exact", "loving", "other", "the"]
+
+
+def test_certain_only_for_normalized_exact():
+    posts = [
+        _Submission("exact", "Love Beyond Fate", "bob", age=2 * HOUR),
+        _Submission("fuzzy", "Love Beyond the Fate", "bob", age=3 * HOUR),
+        _Submission("loving", "Loving Beyond Fate", "bob", age=4 * HOUR),
+    ]
+    rep = _match("Love Beyond Fate", posts)
+    got = {e["candidate"]["title"]: (e["score"], e["type"], e["certainty"]) for e in rep["top"]}
+    assert got == {
+        "Love Beyond Fate": (100, "normalized_exact", "certain"),
+        "Love Beyond the Fate": (100, "fuzzy", "borderline"),   # ≥ auto, ale nie exact
+        "Loving Beyond Fate": (88, "fuzzy", "borderline"),
+    }
+
+
+def test_ties_broken_by_created_then_pool_order():
+    posts = [
+        _Submission("old", "Love Beyond Fate", "bob", age=2 * HOUR),
+        _Submission("new1", "Love Beyond Fate", "bob", age=1 * HOUR),
+        _Submission("new2", "LOVE BEYOND FATE", "bob", age=1 * HOUR),
+        _Submission("new3", "love beyond fate", "bob", age=1 * HOUR),
+    ]
+    rep = _match("Love Beyond Fate", posts)
+    # (score, created) równe → kolejność w puli (/new), jak stabilny sort
+    assert _ids(rep["top"]) == ["new1", "new2", "new3"]
+    assert _ids([rep["best"]]) == ["new1"]
+
+
+def test_app_context_and_alias_segments_are_exact():
+    posts = [
+        _Submission("app", "Love Beyond Fate (ShortMax)", "bob", age=1 * HOUR),
+        _Submission("seg", "Secret Wife or Love Beyond Fate", "bob", age=2 * HOUR),
+        _Submission("aka", "Hidden Heiress aka Love Beyond Fate", "bob", age=3 * HOUR),
+        # "/" i "|" znikają w normalizacji, zanim tytuł jest dzielony na segmenty
+        _Submission("slash", "Secret Wife / Love Beyond Fate", "bob", age=4 * HOUR),
+    ]
+    rep = _match("Love Beyond Fate on Shortmax", posts)
+    assert _ids(rep["top"]) == ["app", "seg", "aka"]
+    assert all(e["type"] == "normalized_exact" and e["score"] == 100 for e in rep["top"])
+
+
+def test_alias_variant_and_first_variant_wins_ties():
+    posts = [_Submission("hit", "Love Beyond Fate", "bob", age=1 * HOUR)]
+    rep = _match('Need the link for "Love Beyond Fate" please', posts)
+    # pełny tytuł (1. wariant) daje fuzzy 100, alias z cudzysłowu — exact 100;
+    # best zmienia wariant tylko przy wyższym wyniku, więc zostaje fuzzy
+    assert [(e["score"], e["type"]) for e in rep["top"]] == [(100, "fuzzy"), (100, "normalized_exact")]
+    assert rep["best"] is rep["top"][0]
+    assert rep["best"]["certainty"] == "borderline"
+
+
+def test_relation_same_different_unknown():
+    posts = [
+        _Submission("same", "Love Beyond Fate", "ALICE", age=1 * HOUR),
+        _Submission("diff", "Love Beyond Fate", "bob", age=2 * HOUR),
+        _Submission("gone", "Love Beyond Fate", None, age=3 * HOUR),   # [deleted]
+    ]
+    rep = _match("Love Beyond Fate", posts, author="alice")
+    assert [e["relation"] for e in rep["top"]] == ["same_author", "different_author", "unknown"]
+
+    rep = _match("Love Beyond Fate", posts, author=None)
+    assert {e["relation"] for e in rep["top"]} == {"unknown"}
+
+
+def test_relation_uses_casefold_and_plain_strings():
+    # casefold, nie lower: "ß" == "ss"
+    posts = [_Submission("p", "Love Beyond Fate", "Strasse", age=HOUR)]
+    assert _match("Love Beyond Fate", posts, author="straße")["best"]["relation"] == "same_author"
+    # str spoza _cf (nie internowany) też porównywany po wartości
+    name = "".join(["b", "ob"])
+    assert title_matcher._relation(title_matcher._cf("Bob"), name) == "same_author"
+
+
+def test_excluded_post_and_modqueue_dedup():
+    posts = [
+        _Submission("self", "Love Beyond Fate", "alice", age=0.1 * HOUR),
+        _Submission("dup", "Love Beyond Fate", "bob", age=1 * HOUR),
+    ]
+    queue = [
+        _Submission("dup", "Love Beyond Fate", "bob", age=1 * HOUR),
+        _Submission("mq", "Love Beyond Fate", "carol", age=2 * HOUR),
+    ]
+    rep = _match("Love Beyond Fate", posts, queue=queue, exclude_post_id="self")
+    assert rep["pool_ids"] == ["dup", "mq"]
+    assert _ids(rep["top"]) == ["dup", "mq"]
+
+
+def test_nothing_above_cutoff_reports_no_best():
+    posts = [
+        _Submission("a", "Secret Wife of the CEO", "bob"),
+        _Submission("b", "Twin Sisters Revenge", "bob"),
+    ]
+    rep = _match("Love Beyond Fate", posts)
+    assert rep["best"] is None
+    assert rep["top"] == []
+    assert rep["pool_ids"] == ["a", "b"]
+
+
+def test_without_cdist_the_report_is_identical(monkeypatch):
+    posts = [
+        _Submission("fates", "Love Beyond Fates", "bob", age=1 * HOUR),
+        _Submission("exact", "love, beyond FATE!", "ALICE", age=5 * HOUR),
+        _Submission("loving", "Loving Beyond Fate", "bob", age=2 * HOUR),
+        _Submission("other", "Secret Wife of the CEO", "bob", age=1 * HOUR),
+        _Submission("the", "Love Beyond the Fate", None, age=3 * HOUR),
+        _Submission("app", "Love Beyond Fate (Dramabox)", "bob", age=4 * HOUR),
+        _Submission("seg", "Hidden Heiress | Love Beyond Fates", "bob", age=6 * HOUR),
+    ]
+    title = 'Love Beyond Fate aka "Loving Beyond Fate"'
+    with_cdist = _match(title, posts)
+    assert title_matcher._fuzzy_matrix(["a"], ["a"]) is not None
+
+    title_matcher.cache_clear()
+    title_matcher._POOL_CACHE.clear()
+    monkeypatch.setattr(title_matcher, "process", None)
+    assert title_matcher._fuzzy_matrix(["a"], ["a"]) is None
+    assert _match(title, posts) == with_cdist
+
+
+def test_punct_spans_literal_matches_unicodedata():
+    import unicodedata
+    if unicodedata.unidata_version != title_matcher._PUNCT_UNIDATA:
+        pytest.skip("inna wersja Unicode — _PUNCT_RE liczony przy imporcie")
+    assert list(title_matcher._PUNCT_SPANS) == title_matcher._punct_spans()
+    assert title_matcher._normalize_title("「霸道總裁」—愛上我！") == "霸道總裁 愛上我"
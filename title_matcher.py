@@ -9,30 +9,45 @@
 # - Candidate pool from recent subreddit posts with flairs:
 #     📌 Link Request, 🔗 Found & Shared, ✅ Request Complete
 # - Thresholds read from config.yaml (fallbacks if missing)
-# - Returns a stable report: {"best": {...} or None, "top": [...], "pool_ids": [...]}
+# - Returns a stable report: {"best": {...} or None, "top": [...], "pool_ids": [...]};
+#   best/top list only candidates scoring ≥ title_threshold_border − 5
 
 from __future__ import annotations
 
+import heapq
 import unicodedata
 import re
+import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+@lru_cache(maxsize=8192)
+def _tokset(s: str) -> frozenset:
+    # zbiór tokenów liczony raz na string — ten sam tytuł kandydata
+    # porównujemy z każdym wariantem zapytania
+    return frozenset(s.split())
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
 except Exception:  # pragma: no cover
+    process = None
     # minimal fallback (very rarely used; strongly recommend rapidfuzz)
-    def _ratio(a: str, b: str) -> int:
+    def _ratio(a: str, b: str, score_cutoff: float = 0) -> int:
         # simple normalized Levenshtein-ish ratio placeholder
         if not a and not b:
             return 100
         if not a or not b:
             return 0
         # naive token-set overlap
-        sa, sb = set(a.split()), set(b.split())
+        sa, sb = _tokset(a), _tokset(b)
         if not sa or not sb:
             return 0
-        return int(100 * len(sa & sb) / max(1, len(sa | sb)))
+        inter = len(sa & sb)
+        r = int(100 * inter / max(1, len(sa) + len(sb) - inter))
+        # jak w rapidfuzz: wynik poniżej score_cutoff → 0
+        return r if r >= score_cutoff else 0
     class fuzz:
         token_set_ratio = staticmethod(_ratio)
 
@@ -78,10 +93,87 @@ def _flairs(cfg: Optional[dict]) -> List[str]:
         return fl
     return FLAIRS_DEFAULT[:]
 
+@lru_cache(maxsize=8)
+def _allowed_flairs(flairs: Tuple[str, ...]) -> frozenset:
+    # lista flair z configu jest stała — zbiór budujemy raz, filtr to jeden lookup
+    return frozenset(flairs)
+
 # ---------- Normalization (CJK-safe) ----------
 
 _PUNCT_CATS = {"Pc", "Pd", "Pe", "Pf", "Pi", "Po", "Ps"}
 
+# ASCII: NFKC niczego nie zmienia, casefold == lower, a interpunkcję (te same kategorie P*)
+# zdejmuje tabela dla str.translate — cała pętla po znakach idzie w C
+_ASCII_PUNCT_TBL = str.maketrans(
+    {chr(c): " " for c in range(128) if unicodedata.category(chr(c)) in _PUNCT_CATS}
+)
+
+def _punct_spans() -> List[Tuple[int, int]]:
+    """
+    Wszystkie punkty kodowe z kategorii P*, sklejone w zakresy (a, b) — skan
+    ~1.1M znaków (~150 ms). Generator dla _PUNCT_SPANS:
+      python -c "import title_matcher as t; print(t._punct_spans())"
+    """
+    spans: List[Tuple[int, int]] = []
+    for c in range(sys.maxunicode + 1):
+        if unicodedata.category(chr(c)) in _PUNCT_CATS:
+            if spans and spans[-1][1] == c - 1:
+                spans[-1] = (spans[-1][0], c)
+            else:
+                spans.append((c, c))
+    return spans
+
+# Wynik _punct_spans() dla danych Unicode _PUNCT_UNIDATA (Python 3.11 w workflowach) —
+# cron startuje nowy proces co 10 min, więc skanu nie robimy przy każdym imporcie.
+# Inna wersja unicodedata → liczymy od nowa, żeby klasa zgadzała się z category().
+_PUNCT_UNIDATA = "14.0.0"
+_PUNCT_SPANS: Tuple[Tuple[int, int], ...] = (
+    (0x0021, 0x0023), (0x0025, 0x002A), (0x002C, 0x002F), (0x003A, 0x003B), (0x003F, 0x0040), (0x005B, 0x005D),
+    (0x005F, 0x005F), (0x007B, 0x007B), (0x007D, 0x007D), (0x00A1, 0x00A1), (0x00A7, 0x00A7), (0x00AB, 0x00AB),
+    (0x00B6, 0x00B7), (0x00BB, 0x00BB), (0x00BF, 0x00BF), (0x037E, 0x037E), (0x0387, 0x0387), (0x055A, 0x055F),
+    (0x0589, 0x058A), (0x05BE, 0x05BE), (0x05C0, 0x05C0), (0x05C3, 0x05C3), (0x05C6, 0x05C6), (0x05F3, 0x05F4),
+    (0x0609, 0x060A), (0x060C, 0x060D), (0x061B, 0x061B), (0x061D, 0x061F), (0x066A, 0x066D), (0x06D4, 0x06D4),
+    (0x0700, 0x070D), (0x07F7, 0x07F9), (0x0830, 0x083E), (0x085E, 0x085E), (0x0964, 0x0965), (0x0970, 0x0970),
+    (0x09FD, 0x09FD), (0x0A76, 0x0A76), (0x0AF0, 0x0AF0), (0x0C77, 0x0C77), (0x0C84, 0x0C84), (0x0DF4, 0x0DF4),
+    (0x0E4F, 0x0E4F), (0x0E5A, 0x0E5B), (0x0F04, 0x0F12), (0x0F14, 0x0F14), (0x0F3A, 0x0F3D), (0x0F85, 0x0F85),
+    (0x0FD0, 0x0FD4), (0x0FD9, 0x0FDA), (0x104A, 0x104F), (0x10FB, 0x10FB), (0x1360, 0x1368), (0x1400, 0x1400),
+    (0x166E, 0x166E), (0x169B, 0x169C), (0x16EB, 0x16ED), (0x1735, 0x1736), (0x17D4, 0x17D6), (0x17D8, 0x17DA),
+    (0x1800, 0x180A), (0x1944, 0x1945), (0x1A1E, 0x1A1F), (0x1AA0, 0x1AA6), (0x1AA8, 0x1AAD), (0x1B5A, 0x1B60),
+    (0x1B7D, 0x1B7E), (0x1BFC, 0x1BFF), (0x1C3B, 0x1C3F), (0x1C7E, 0x1C7F), (0x1CC0, 0x1CC7), (0x1CD3, 0x1CD3),
+    (0x2010, 0x2027), (0x2030, 0x2043), (0x2045, 0x2051), (0x2053, 0x205E), (0x207D, 0x207E), (0x208D, 0x208E),
+    (0x2308, 0x230B), (0x2329, 0x232A), (0x2768, 0x2775), (0x27C5, 0x27C6), (0x27E6, 0x27EF), (0x2983, 0x2998),
+    (0x29D8, 0x29DB), (0x29FC, 0x29FD), (0x2CF9, 0x2CFC), (0x2CFE, 0x2CFF), (0x2D70, 0x2D70), (0x2E00, 0x2E2E),
+    (0x2E30, 0x2E4F), (0x2E52, 0x2E5D), (0x3001, 0x3003), (0x3008, 0x3011), (0x3014, 0x301F), (0x3030, 0x3030),
+    (0x303D, 0x303D), (0x30A0, 0x30A0), (0x30FB, 0x30FB), (0xA4FE, 0xA4FF), (0xA60D, 0xA60F), (0xA673, 0xA673),
+    (0xA67E, 0xA67E), (0xA6F2, 0xA6F7), (0xA874, 0xA877), (0xA8CE, 0xA8CF), (0xA8F8, 0xA8FA), (0xA8FC, 0xA8FC),
+    (0xA92E, 0xA92F), (0xA95F, 0xA95F), (0xA9C1, 0xA9CD), (0xA9DE, 0xA9DF), (0xAA5C, 0xAA5F), (0xAADE, 0xAADF),
+    (0xAAF0, 0xAAF1), (0xABEB, 0xABEB), (0xFD3E, 0xFD3F), (0xFE10, 0xFE19), (0xFE30, 0xFE52), (0xFE54, 0xFE61),
+    (0xFE63, 0xFE63), (0xFE68, 0xFE68), (0xFE6A, 0xFE6B), (0xFF01, 0xFF03), (0xFF05, 0xFF0A), (0xFF0C, 0xFF0F),
+    (0xFF1A, 0xFF1B), (0xFF1F, 0xFF20), (0xFF3B, 0xFF3D), (0xFF3F, 0xFF3F), (0xFF5B, 0xFF5B), (0xFF5D, 0xFF5D),
+    (0xFF5F, 0xFF65), (0x10100, 0x10102), (0x1039F, 0x1039F), (0x103D0, 0x103D0), (0x1056F, 0x1056F), (0x10857, 0x10857),
+    (0x1091F, 0x1091F), (0x1093F, 0x1093F), (0x10A50, 0x10A58), (0x10A7F, 0x10A7F), (0x10AF0, 0x10AF6), (0x10B39, 0x10B3F),
+    (0x10B99, 0x10B9C), (0x10EAD, 0x10EAD), (0x10F55, 0x10F59), (0x10F86, 0x10F89), (0x11047, 0x1104D), (0x110BB, 0x110BC),
+    (0x110BE, 0x110C1), (0x11140, 0x11143), (0x11174, 0x11175), (0x111C5, 0x111C8), (0x111CD, 0x111CD), (0x111DB, 0x111DB),
+    (0x111DD, 0x111DF), (0x11238, 0x1123D), (0x112A9, 0x112A9), (0x1144B, 0x1144F), (0x1145A, 0x1145B), (0x1145D, 0x1145D),
+    (0x114C6, 0x114C6), (0x115C1, 0x115D7), (0x11641, 0x11643), (0x11660, 0x1166C), (0x116B9, 0x116B9), (0x1173C, 0x1173E),
+    (0x1183B, 0x1183B), (0x11944, 0x11946), (0x119E2, 0x119E2), (0x11A3F, 0x11A46), (0x11A9A, 0x11A9C), (0x11A9E, 0x11AA2),
+    (0x11C41, 0x11C45), (0x11C70, 0x11C71), (0x11EF7, 0x11EF8), (0x11FFF, 0x11FFF), (0x12470, 0x12474), (0x12FF1, 0x12FF2),
+    (0x16A6E, 0x16A6F), (0x16AF5, 0x16AF5), (0x16B37, 0x16B3B), (0x16B44, 0x16B44), (0x16E97, 0x16E9A), (0x16FE2, 0x16FE2),
+    (0x1BC9F, 0x1BC9F), (0x1DA87, 0x1DA8B), (0x1E95E, 0x1E95F),
+)
+
+def _punct_char_class(spans: Iterable[Tuple[int, int]]) -> str:
+    """Zawartość klasy znaków regexu z zakresów a-b (moduł `re` nie zna \\p{P})."""
+    return "".join(
+        re.escape(chr(a)) if a == b else f"{re.escape(chr(a))}-{re.escape(chr(b))}"
+        for a, b in spans
+    )
+
+# Poza ASCII: interpunkcję zdejmuje silnik regexu (C), a nie pętla z unicodedata.category per znak
+_PUNCT_RE = re.compile("[%s]" % _punct_char_class(
+    _PUNCT_SPANS if unicodedata.unidata_version == _PUNCT_UNIDATA else _punct_spans()
+))
+
 def _normalize_title(s: str) -> str:
     """
     NFKC + casefold → drop Unicode punctuation → collapse whitespace.
@@ -89,17 +181,85 @@ def _normalize_title(s: str) -> str:
     """
     if not s:
         return ""
-    s = unicodedata.normalize("NFKC", s).casefold()
-    s = "".join(ch if unicodedata.category(ch) not in _PUNCT_CATS else " " for ch in s)
-    s = re.sub(r"\s+", " ", s, flags=re.UNICODE).strip()
-    return s
+    return _normalize_title_cached(s)
+
+# te same tytuły wracają przy każdym przebiegu bota — normalizacja z cache
+@lru_cache(maxsize=8192)
+def _normalize_title_cached(s: str) -> str:
+    if s.isascii():
+        return " ".join(s.lower().translate(_ASCII_PUNCT_TBL).split())
+    # Quick Check (UAX #15): większość tytułów jest już w NFKC — wtedy bez alokacji nowego stringu
+    if not unicodedata.is_normalized("NFKC", s):
+        s = unicodedata.normalize("NFKC", s)
+    s = _PUNCT_RE.sub(" ", s.casefold())
+    # split() bez argumentu tnie po tych samych znakach co \s (str.isspace)
+    return " ".join(s.split())
 
 # ---------- Candidate building ----------
 
 def _utc_now() -> float:
     return time.time()
 
-def _fetch_recent_candidates(
+_SUBMISSION_FIELDS = ("id", "title", "created_utc", "author", "link_flair_text", "permalink")
+
+@dataclass(slots=True)
+class CandRow:
+    """
+    Kandydat z puli: pola odczytane jednorazowo z obiektu PRAW (lazy proxy),
+    dalej w pętlach tylko zwykły dostęp do atrybutów.
+    """
+    id: Optional[str]
+    title: Optional[str]
+    created_utc: float
+    author: Optional[str]
+    flair: Optional[str]
+    permalink: Optional[str]
+    norm_title: str = ""
+    author_cf: Optional[str] = None
+
+    @classmethod
+    def from_submission(cls, s: Any) -> "CandRow":
+        # Czytamy z vars(s), czyli tylko pola, które przyszły już w JSON-ie listingu.
+        # getattr na polu, którego tam nie ma, to w PRAW lazy fetch = osobny request per post.
+        try:
+            d = vars(s)
+        except TypeError:
+            d = {k: getattr(s, k, None) for k in _SUBMISSION_FIELDS}
+        return cls(
+            id=d.get("id"),
+            title=d.get("title"),
+            created_utc=d.get("created_utc") or 0.0,
+            author=getattr(d.get("author"), "name", None),
+            flair=d.get("link_flair_text"),
+            permalink=d.get("permalink"),
+        )
+
+def _row_ok(
+    row: CandRow,
+    min_ts: float,
+    flairs: frozenset,
+    exclude_post_id: Optional[str],
+    exclude_post_url: Optional[str],
+) -> bool:
+    # time filter
+    if row.created_utc < min_ts:
+        return False
+    # flair filter (string match on link_flair_text)
+    if (row.flair or "") not in flairs:
+        return False
+    # exclude current post
+    if exclude_post_id and row.id == exclude_post_id:
+        return False
+    if exclude_post_url and row.permalink == exclude_post_url:
+        return False
+    return True
+
+def _finish_row(row: CandRow) -> CandRow:
+    row.norm_title = _normalize_title(row.title or "")
+    row.author_cf = _cf(row.author) if row.author else None
+    return row
+
+def _iter_recent_candidates(
     reddit: Any,
     subreddit_name: str,
     window_days: int,
@@ -107,81 +267,143 @@ def _fetch_recent_candidates(
     flairs: Optional[List[str]] = None,
     exclude_post_id: Optional[str] = None,
     exclude_post_url: Optional[str] = None,
-) -> List[Any]:
+) -> Iterator[CandRow]:
     """
-    Build a recent candidate pool from subreddit, filtered by time window and flair.
+    Stream a recent candidate pool from subreddit, filtered by time window and flair.
     Uses /new() + mod queque  — najprostsze i wystarczające (modqueue pobierasz gdzie indziej).
+    Yields CandRow (z policzonym norm_title) — pula nie jest materializowana w pamięci.
     """
     flairs = flairs or _flairs(None)
-    out: List[Any] = []
+
+    allowed = _allowed_flairs(tuple(flairs))
     try:
         sub = reddit.subreddit(subreddit_name)
         now = _utc_now()
         min_ts = now - window_days * 86400
-        
+        seen_ids = set()
+
         # źródło 1
         for s in sub.new(limit=limit_per_source):
             try:
-                # time filter
-                if getattr(s, "created_utc", 0.0) < min_ts:
-                    continue
-                # flair filter (string match on link_flair_text)
-                lf = getattr(s, "link_flair_text", None) or ""
-                if lf not in flairs:
-                    continue
-                # exclude current post
-                if exclude_post_id and getattr(s, "id", None) == exclude_post_id:
+                row = CandRow.from_submission(s)
+                if not _row_ok(row, min_ts, allowed, exclude_post_id, exclude_post_url):
                     continue
-                if exclude_post_url and getattr(s, "permalink", None) == exclude_post_url:
-                    continue
-                out.append(s)
+                if row.id:
+                    seen_ids.add(row.id)
+                _finish_row(row)
             except Exception:
                 continue
-        
+            yield row
+
         # --- źródło 2: Mod Queue (dodatkowe kandydaty) ---
-        seen_ids = {getattr(s, "id", None) for s in out}
+        # Po /new, nie w osobnym wątku: PRAW nie jest thread-safe (wspólna sesja i rate limiter)
         try:
             for s in sub.mod.modqueue(limit=limit_per_source):
                 try:
-                    # time filter
-                    if getattr(s, "created_utc", 0.0) < min_ts:
+                    row = CandRow.from_submission(s)
+                    if not _row_ok(row, min_ts, allowed, exclude_post_id, exclude_post_url):
                         continue
-                    # flair filter (string match on link_flair_text)
-                    lf = getattr(s, "link_flair_text", None) or ""
-                    if lf not in flairs:
+                    if row.id and row.id in seen_ids:
                         continue
-                    # exclude current post
-                    if exclude_post_id and getattr(s, "id", None) == exclude_post_id:
-                        continue
-                    if exclude_post_url and getattr(s, "permalink", None) == exclude_post_url:
-                        continue
-                    sid = getattr(s, "id", None)
-                    if sid and sid in seen_ids:
-                        continue
-                    out.append(s)
-                    if sid:
-                        seen_ids.add(sid)
+                    if row.id:
+                        seen_ids.add(row.id)
+                    _finish_row(row)
                 except Exception:
                     continue
+                yield row
         except Exception:
+            # brak uprawnień moda itp. — zostaje samo /new
             pass
     except Exception:
-        # reddit or network error — return whatever we have (likely empty)
-        return out
-    return out
+        # reddit or network error — stop streaming (whatever was yielded stays)
+        return
+
+# ---------- Session pool cache ----------
+
+# Kolejne match_title_for_post w jednym przebiegu bota pytają o tę samą pulę —
+# przez _POOL_TTL sekund zwracamy ją z pamięci zamiast znów odpytywać /new i modqueue.
+_POOL_TTL = 60.0
+_POOL_CACHE: Dict[Tuple[str, int, int, Tuple[str, ...]], Tuple[float, List[CandRow]]] = {}
+
+def _recent_pool(
+    reddit: Any,
+    subreddit_name: str,
+    window_days: int,
+    limit_per_source: int,
+    flairs: Optional[List[str]] = None,
+    exclude_post_id: Optional[str] = None,
+    exclude_post_url: Optional[str] = None,
+) -> List[CandRow]:
+    """
+    Pula kandydatów z krótkim cache w pamięci (klucz: subreddit + okno + limit + flairy).
+    Cache trzyma pulę bez wykluczeń; exclude i przesunięcie okna nakładamy przy odczycie.
+    """
+    flairs = flairs or _flairs(None)
+    key = (subreddit_name, window_days, limit_per_source, tuple(sorted(flairs)))
+    now = _utc_now()
+    hit = _POOL_CACHE.get(key)
+    if hit is None or now - hit[0] >= _POOL_TTL:
+        rows = list(_iter_recent_candidates(
+            reddit=reddit,
+            subreddit_name=subreddit_name,
+            window_days=window_days,
+            limit_per_source=limit_per_source,
+            flairs=flairs,
+        ))
+        if not rows:
+            # pusta pula to zwykle błąd sieci — nie zapamiętujemy jej
+            return rows
+        # przy zapisie wyrzucamy przeterminowane wpisy (także dla innych kluczy)
+        for k in [k for k, (ts, _) in _POOL_CACHE.items() if now - ts >= _POOL_TTL]:
+            del _POOL_CACHE[k]
+        hit = _POOL_CACHE[key] = (now, rows)
+
+    min_ts = now - window_days * 86400
+    return [
+        r for r in hit[1]
+        if r.created_utc >= min_ts
+        and not (exclude_post_id and r.id == exclude_post_id)
+        and not (exclude_post_url and r.permalink == exclude_post_url)
+    ]
 
 # ---------- Scoring ----------
 
-def _relation(author_a: Optional[str], author_b: Optional[str]) -> str:
-    if not author_a or not author_b:
+_AUTHOR_CF_MAX = 4096
+_author_cf_cache: Dict[str, str] = {}
+
+def _cf(name: str) -> str:
+    """
+    casefold + sys.intern (z ograniczonym cache) — równe nazwy autorów
+    to ten sam obiekt, więc `==` w _relation kończy się na porównaniu tożsamości.
+    """
+    r = _author_cf_cache.get(name)
+    if r is None:
+        if len(_author_cf_cache) >= _AUTHOR_CF_MAX:
+            _author_cf_cache.clear()
+        r = sys.intern(name.casefold())
+        _author_cf_cache[name] = r
+    return r
+
+def _relation(author_cf: Optional[str], cand_author_cf: Optional[str]) -> str:
+    """Obie nazwy już po _cf() (autor posta liczony raz na match_title, kandydat przy fetchu)."""
+    if not author_cf or not cand_author_cf:
         return "unknown"
-    return "same_author" if author_a.casefold() == author_b.casefold() else "different_author"
+    # `==`, nie `is`: dla internowanych nazw i tak kończy się na tożsamości,
+    # a nazwa spoza _cf (zwykły str) nie da po cichu different_author
+    return "same_author" if author_cf == cand_author_cf else "different_author"
 
 APP_NAMES = ("shortmax", "shortwave", "dramabox", "kalos")
 
 # zbuduj część regexu z listy powyżej
 _APP_ALT = r"(?:%s)" % "|".join(APP_NAMES)
 
+_APP_NAME_RE = re.compile(_APP_ALT, flags=re.I)
+_APP_CTX_RE = re.compile(rf"\b(?:on|in|via|from|at)\s+{_APP_ALT}\b", flags=re.I)
+_APP_PAREN_RE = re.compile(rf"(?:[\(\[\-,:]\s*{_APP_ALT}\s*[\)\]])\s*$", flags=re.I)
+_APP_TAIL_RE = re.compile(rf"\s{_APP_ALT}\s*$", flags=re.I)
+_WS_RE = re.compile(r"\s+")
+
+@lru_cache(maxsize=8192)
 def _strip_app_context(s: str) -> str:
     """
     Usuwa kontekst typu 'on/in/via <APP>' oraz nawiasowe/końcowe wstawki z nazwą aplikacji.
@@ -189,60 +411,154 @@ def _strip_app_context(s: str) -> str:
     """
     if not s:
         return s
+    # Każdy z trzech wzorców wymaga nazwy aplikacji — bez niej (zdecydowana większość
+    # tytułów) wystarczy jeden skan zamiast trzech podstawień.
+    if not _APP_NAME_RE.search(s):
+        return _WS_RE.sub(" ", s).strip()
     # 'on/in/via/from/at APP'
-    s2 = re.sub(rf"\b(?:on|in|via|from|at)\s+{_APP_ALT}\b", " ", s, flags=re.I)
+    s2 = _APP_CTX_RE.sub(" ", s)
     # nawiasy/końcówki: '(APP)', '- APP', ', APP', ': APP' itp. na końcu lub prawie końcu
-    s2 = re.sub(rf"(?:[\(\[\-,:]\s*{_APP_ALT}\s*[\)\]])\s*$", " ", s2, flags=re.I)
-    s2 = re.sub(rf"\s{_APP_ALT}\s*$", " ", s2, flags=re.I)
+    s2 = _APP_PAREN_RE.sub(" ", s2)
+    s2 = _APP_TAIL_RE.sub(" ", s2)
     # porządkowanie spacji
-    s2 = re.sub(r"\s+", " ", s2).strip()
+    s2 = _WS_RE.sub(" ", s2).strip()
     return s2
 
 _SEG_SEP = re.compile(r"\s*(?:/|\||\baka\b|\bor\b)\s*", flags=re.I)
 
-def _segment_variants(s: str) -> list[str]:
+@lru_cache(maxsize=8192)
+def _segment_variants(s: str) -> Tuple[str, ...]:
     """
     Dzieli znormalizowany tytuł na segmenty aliasów (np. 'A / B' → ['a', 'b']),
     przycina i składa spacje. Zwraca co najmniej 1 element (gdy brak separatorów).
+    Krotka, bo wynik siedzi w lru_cache i nie może być modyfikowany.
     """
     if not s:
-        return []
-    parts = [p.strip() for p in _SEG_SEP.split(s) if p and p.strip()]
+        return ()
+    parts = tuple(p.strip() for p in _SEG_SEP.split(s) if p and p.strip())
     if not parts:
-        return [s.strip()]
+        return (s.strip(),)
     return parts
 
-def _score_pair(q_norm: str, c_norm: str) -> Tuple[int, str]:
+PairKeys = Tuple[str, frozenset, frozenset]
+
+@lru_cache(maxsize=8192)
+def _pair_keys(s: str) -> PairKeys:
+    """
+    (tytuł bez kontekstu APP, zbiór segmentów, zbiór niepustych segmentów bez kontekstu APP) —
+    liczone raz na tytuł, a nie raz na parę; w _score_pair reguły exact to lookupy w zbiorach.
+    """
+    segs = _segment_variants(s)
+    segs_alt = frozenset(_strip_app_context(seg) for seg in segs)
+    return _strip_app_context(s), frozenset(segs), segs_alt - {""}
+
+def _score_pair(
+    q_norm: str,
+    c_norm: str,
+    fuzzy: Optional[float] = None,
+    q_keys: Optional[PairKeys] = None,
+    c_keys: Optional[PairKeys] = None,
+    min_score: int = 0,
+) -> Tuple[int, str]:
     """
     Returns (score, match_type). match_type in {"normalized_exact", "fuzzy"}.
+    `fuzzy` — token_set_ratio policzony wcześniej (np. z _fuzzy_matrix).
+    `q_keys`/`c_keys` — wynik _pair_keys, jeśli wywołujący ma go już policzonego.
+    `min_score` — score_cutoff dla fuzzy: wynik poniżej progu to (0, "fuzzy"); pary,
+    które na pewno go nie osiągną, w ogóle nie trafiają do scorera.
     """
     if q_norm and c_norm and q_norm == c_norm:
         return 100, "normalized_exact"
 
+    if q_keys is None:
+        q_keys = _pair_keys(q_norm)
+    if c_keys is None:
+        c_keys = _pair_keys(c_norm)
+    q_alt, q_segs, q_segs_alt = q_keys
+    c_alt, c_segs, c_segs_alt = c_keys
+
     # exact po zdjęciu kontekstu aplikacji (Shortmax/Shortwave/Dramabox/Kalos)
-    q_alt = _strip_app_context(q_norm)
-    c_alt = _strip_app_context(c_norm)
     if q_alt and c_alt and q_alt == c_alt:
         return 100, "normalized_exact"
 
     # NOWE: exact, jeśli jedna strona równa któremuś segmentowi drugiej (A / B, A | B, A or B, A aka B)
-    q_segs = _segment_variants(q_norm)
-    c_segs = _segment_variants(c_norm)
-    if q_segs and c_segs:
-        # q == któryś segment c
-        if any(q_norm == seg for seg in c_segs):
-            return 100, "normalized_exact"
-        # c == któryś segment q
-        if any(c_norm == seg for seg in q_segs):
-            return 100, "normalized_exact"
-        # po zdjęciu kontekstu APP
-        q_segs_alt = [_strip_app_context(seg) for seg in q_segs]
-        c_segs_alt = [_strip_app_context(seg) for seg in c_segs]
-        if any(q_alt == seg for seg in c_segs_alt if seg) or any(c_alt == seg for seg in q_segs_alt if seg):
-            return 100, "normalized_exact"
+    # (q == segment c, c == segment q, to samo po zdjęciu kontekstu APP)
+    if q_segs and c_segs and (
+        q_norm in c_segs or c_norm in q_segs or q_alt in c_segs_alt or c_alt in q_segs_alt
+    ):
+        return 100, "normalized_exact"
 
     # w pozostałych wypadkach fuzzy
-    return int(fuzz.token_set_ratio(q_norm, c_norm)), "fuzzy"
+    if fuzzy is None:
+        if min_score and _fuzzy_below(q_norm, c_norm, min_score):
+            return 0, "fuzzy"
+        fuzzy = fuzz.token_set_ratio(q_norm, c_norm, score_cutoff=min_score)
+    return int(fuzzy), "fuzzy"
+
+def _fuzzy_below(q_norm: str, c_norm: str, min_score: int) -> bool:
+    """
+    True, gdy token_set_ratio(q, c) na pewno < min_score. Bez wspólnych tokenów
+    token_set_ratio to ratio posortowanych tokenów, a ratio ≤ 200·min(la, lb)/(la + lb)
+    (la, lb — długości tych tokenów sklejonych spacją).
+    """
+    qa, cb = _tokset(q_norm), _tokset(c_norm)
+    if not qa or not cb:
+        return True
+    if not qa.isdisjoint(cb):
+        return False
+    la = sum(map(len, qa)) + len(qa) - 1
+    lb = sum(map(len, cb)) + len(cb) - 1
+    return 200 * min(la, lb) < min_score * (la + lb)
+
+# Para (zapytanie, kandydat) wraca między wariantami i kolejnymi przebiegami bota
+# (pula jest „lepka”) — bez cdist wynik pary bierzemy z cache. lru_cache jest thread-safe.
+@lru_cache(maxsize=16384)
+def _score_pair_cached(q_norm: str, c_norm: str, min_score: int = 0) -> Tuple[int, str]:
+    return _score_pair(q_norm, c_norm, min_score=min_score)
+
+def _fuzzy_matrix(
+    queries: List[str],
+    cand_norms: List[str],
+    score_cutoff: int = 0,
+) -> Optional[List[List[float]]]:
+    """
+    token_set_ratio dla wszystkich par (wariant × kandydat) jednym wywołaniem
+    rapidfuzz.process.cdist (C++, wiele wątków). None → licz per para.
+    """
+    if process is None or not queries or not cand_norms:
+        return None
+    try:
+        m = process.cdist(queries, cand_norms, scorer=fuzz.token_set_ratio,
+                          score_cutoff=score_cutoff, workers=-1)
+    except Exception:
+        # cdist wymaga numpy — bez niego zostaje ścieżka per para
+        return None
+    return m.tolist()
+
+def cache_clear() -> None:
+    """Czyści cache normalizacji i wariantów tytułów (np. między testami)."""
+    _normalize_title_cached.cache_clear()
+    _strip_app_context.cache_clear()
+    _segment_variants.cache_clear()
+    _pair_keys.cache_clear()
+    _score_pair_cached.cache_clear()
+    _tokset.cache_clear()
+    _author_cf_cache.clear()
+
+def cache_info() -> Dict[str, Dict[str, Any]]:
+    """Statystyki cache (hits/misses/maxsize/currsize) — do logów i strojenia maxsize."""
+    return {
+        f.__name__: f.cache_info()._asdict()
+        for f in (_normalize_title_cached, _strip_app_context, _segment_variants,
+                  _pair_keys, _score_pair_cached)
+    }
+
+def _push_top(heap: List[Any], item: Any, k: int = 3) -> None:
+    """Kopiec (min-heap) o rozmiarze k — zostaje k największych elementów."""
+    if len(heap) < k:
+        heapq.heappush(heap, item)
+    else:
+        heapq.heappushpop(heap, item)
 
 def _certainty(score: int, auto_t: int, border_t: int) -> str:
     if score >= auto_t:
@@ -253,17 +569,12 @@ def _certainty(score: int, auto_t: int, border_t: int) -> str:
 
 # ---------- Report builders ----------
 
-def _candidate_info(s: Any) -> Dict[str, Any]:
-    author_name = None
-    try:
-        author_name = getattr(getattr(s, "author", None), "name", None)
-    except Exception:
-        author_name = None
+def _candidate_info(row: CandRow) -> Dict[str, Any]:
     return {
-        "title": getattr(s, "title", None),
-        "permalink": getattr(s, "permalink", None),
-        "flair": getattr(s, "link_flair_text", None),
-        "author": f"u/{author_name}" if author_name else None,
+        "title": row.title,
+        "permalink": row.permalink,
+        "flair": row.flair,
+        "author": f"u/{row.author}" if row.author else None,
     }
 
 def _make_entry(
@@ -271,7 +582,7 @@ def _make_entry(
     certainty: str,
     rel: str,
     match_type: str,
-    cand: Any,
+    cand: CandRow,
 ) -> Dict[str, Any]:
     ent = {
         "score": int(score),
@@ -292,6 +603,7 @@ _ALIAS_CALLED_REGEX = re.compile(
     r"\b(?:(?:called|titled)\s+|it(?:'s|’s)\s+called\s+)([A-Za-z0-9 \-:'“”\"&]{3,80})",
     flags=re.I,
 )
+_ALIAS_CUT_RE = re.compile(r"[.;:|/]\s*")
 
 def _extract_title_aliases(title: str) -> List[str]:
     """
@@ -314,14 +626,14 @@ def _extract_title_aliases(title: str) -> List[str]:
     kw = _ALIAS_CALLED_REGEX.search(txt)
     if kw:
         raw = kw.group(1)
-        raw = re.split(r"[.;:|/]\s*", raw)[0]
+        raw = _ALIAS_CUT_RE.split(raw)[0]
         raw = raw.strip().strip('“”"')
         if 3 <= len(raw) <= 80:
             aliases.append(raw)
 
     # 3) Łączniki: or / | aka
     #    Przykład: "Use her as a cage or With her as a cage"
-    parts = re.split(r"\s*(?:/|\||\baka\b|\bor\b)\s*", txt, flags=re.I)
+    parts = _SEG_SEP.split(txt)
     for p in parts:
         p = p.strip().strip('“”"')
         if 3 <= len(p) <= 80:
@@ -386,6 +698,11 @@ def match_title(
 ) -> Dict[str, Any]:
     """
     General entry (adapter-friendly). Works even if some context is missing.
+
+    Raport: {"best": ..., "top": [...≤3], "pool_ids": [...]}. W best/top trafiają tylko
+    kandydaci z wynikiem ≥ title_threshold_border − 5 (fuzzy liczone ze score_cutoff,
+    niższych wyników nie znamy). Gdy nikt nie dobił do progu: best=None, top=[],
+    a pool_ids nadal wymienia całą pulę. Decyzje (border/auto) to nie zmienia.
     """
     if not title_raw or not subreddit or not reddit:
         # Not enough info to match — return empty report
@@ -396,14 +713,22 @@ def match_title(
     flairs = _flairs(config)
 
     # Zbuduj warianty: pełny tytuł + aliasy z cudzysłowu/po 'called/titled'
-    title_variants: List[str] = []
-    title_variants.append(title_raw)
+    title_variants: List[str] = [title_raw]
+    seen_lower = {title_raw.lower()}
     for alias in _extract_title_aliases(title_raw):
-        if alias.lower() not in [t.lower() for t in title_variants]:
+        al = alias.lower()
+        if al not in seen_lower:
+            seen_lower.add(al)
             title_variants.append(alias)
 
-    # Build pool (recent candidates)
-    pool = _fetch_recent_candidates(
+    queries = [q for q in (_normalize_title(t) for t in title_variants) if q]
+    if not queries:
+        return _empty_report()
+
+    author_cf = _cf(author_name) if author_name else None
+
+    # Pula kandydatów jako lekkie CandRow (obiekty PRAW nie są trzymane)
+    pool = _recent_pool(
         reddit=reddit,
         subreddit_name=subreddit,
         window_days=window_days,
@@ -412,61 +737,111 @@ def match_title(
         exclude_post_id=exclude_post_id,
         exclude_post_url=exclude_post_url,
     )
-
-    # Spróbuj dla każdego wariantu i wybierz najlepszy
-    global_top_entries: List[Dict[str, Any]] = []
-    pool_ids: List[str] = []
-    best_entry: Optional[Dict[str, Any]] = None
-
-    for title_q in title_variants:
-        query_norm = _normalize_title(title_q)
-        if not query_norm:
+    pool_ids: List[str] = [c.id for c in pool if c.id]
+
+    # Pętle punktacji czytają tylko równoległe listy po indeksie (SoA) —
+    # CandRow z puli potrzebny jest dopiero przy budowie wyników dla ocalałych.
+    norms: List[str] = [c.norm_title for c in pool]
+    created: List[float] = [c.created_utc for c in pool]
+
+    # Indeks dokładnych trafień: znormalizowany tytuł → pozycje w puli.
+    # Pełna równość po normalizacji to jeden lookup na wariant, a nie porównanie per para.
+    exact_idx: Dict[str, List[int]] = {}
+    for i, norm in enumerate(norms):
+        exact_idx.setdefault(norm, []).append(i)
+
+    # Wyniki fuzzy dużo poniżej progu border i tak nic nie zmieniają w decyzji —
+    # score_cutoff pozwala rapidfuzz przerwać takie porównanie wcześnie (wynik 0).
+    # Kandydaci poniżej progu nie trafiają do best/top (kontrakt raportu — patrz docstring):
+    # ich prawdziwego wyniku nie znamy, a „0” dla najnowszych postów tylko myliłoby log.
+    fuzzy_cutoff = max(0, border_t - 5)
+    fuzzy_rows = _fuzzy_matrix(queries, norms, fuzzy_cutoff)
+    # warianty APP/segmentów liczone raz na tytuł, wspólne dla wszystkich wariantów zapytania
+    cand_keys = [_pair_keys(n) for n in norms] if fuzzy_rows is not None else None
+
+    # Per wariant trzymamy tylko kopiec top-3 zamiast pełnej listy wyników.
+    # Klucz: score, potem najnowszy; -i rozstrzyga remisy na korzyść wcześniejszych w puli.
+    # W kopcu same krotki (pozycja w puli = -i) — relacja i słowniki wyników
+    # powstają dopiero dla ocalałych.
+    heaps: List[List[Tuple[int, float, int, str]]] = [[] for _ in queries]
+
+    # Warianty, które po normalizacji są identyczne (np. tytuł w cudzysłowie i alias
+    # z cudzysłowu), dostają gotowy wynik pierwszego zamiast ponownego przejścia po puli.
+    scored: Dict[str, int] = {}
+    for qi, (query_norm, heap) in enumerate(zip(queries, heaps)):
+        if query_norm in scored:
+            heaps[qi] = heaps[scored[query_norm]]
             continue
-
-        scored: List[Tuple[int, str, Any, str]] = []  # (score, rel, cand, match_type)
-        for cand in pool:
+        scored[query_norm] = qi
+        fuzzy_row = fuzzy_rows[qi] if fuzzy_rows is not None else None
+        q_keys = _pair_keys(query_norm)
+        exact = exact_idx.get(query_norm, ())
+        for i in exact:
+            _push_top(heap, (100, created[i], -i, "normalized_exact"))
+        skip = set(exact)
+
+        # fuzzy (i pozostałe warianty exact: kontekst APP, segmenty) tylko dla reszty puli
+        for i, norm in enumerate(norms):
+            if i in skip:
+                continue
             try:
-                cand_title = getattr(cand, "title", None) or ""
-                cand_norm = _normalize_title(cand_title)
-                score, mtype = _score_pair(query_norm, cand_norm)
-                rel = _relation(author_name, getattr(getattr(cand, "author", None), "name", None))
-                scored.append((int(score), rel, cand, mtype))
+                if fuzzy_row is None:
+                    score, mtype = _score_pair_cached(query_norm, norm, fuzzy_cutoff)
+                else:
+                    score, mtype = _score_pair(
+                        query_norm, norm, fuzzy_row[i], q_keys, cand_keys[i],
+                    )
+                if score < fuzzy_cutoff:
+                    continue
+                item = (int(score), created[i], -i, mtype)
             except Exception:
                 continue
+            _push_top(heap, item)
 
-        if not scored:
+    # Spróbuj dla każdego wariantu i wybierz najlepszy
+    survivors: List[Tuple[int, float, int, str]] = []
+    best_item: Optional[Tuple[int, float, int, str]] = None
+
+    for heap in heaps:
+        if not heap:
             continue
+        local_top = sorted(heap, reverse=True)
 
-        # sort by score desc, then newest first (if equal)
-        scored.sort(key=lambda t: (t[0], getattr(t[2], "created_utc", 0.0)), reverse=True)
+        # local_top[0] to najlepszy kandydat dla tego wariantu
+        if best_item is None or local_top[0][0] > best_item[0]:
+            best_item = local_top[0]
 
-        local_top: List[Dict[str, Any]] = []
-        for i, (score, rel, cand, mtype) in enumerate(scored):
-            certainty = _certainty(score, auto_t, border_t)
-            # Bezpiecznik: 'certain' tylko dla normalized_exact (pełna równość po normalizacji)
-            if mtype != "normalized_exact" and certainty == "certain":
-                certainty = "borderline"
+        # dołącz lokalny top (zachowujemy do 3 z każdego wariantu, aby log był informacyjny)
+        survivors.extend(local_top)
 
-            entry = _make_entry(score, certainty, rel, mtype, cand)
-            if i < 3:
-                local_top.append(entry)
-            if best_entry is None or entry["score"] > best_entry["score"]:
-                best_entry = entry
+    if best_item is None:
+        # brak kandydatów ≥ fuzzy_cutoff — pula była, ale nic bliskiego
+        rep = _empty_report()
+        rep["pool_ids"] = pool_ids
+        return rep
 
-            pid = getattr(cand, "id", None)
-            if pid:
-                pool_ids.append(pid)
+    # Przytnij globalny top do 3 najlepszych po score (dla czytelności)
+    # (nlargest z key == sorted(..., reverse=True)[:3], łącznie z kolejnością remisów)
+    top_items = heapq.nlargest(3, survivors, key=lambda it: it[0])
 
-        # dołącz lokalny top (zachowujemy do 3 z każdego wariantu, aby log był informacyjny)
-        global_top_entries.extend(local_top)
+    # Słowniki tylko dla best + top (≤ 4), ta sama krotka → ten sam słownik
+    entries: Dict[int, Dict[str, Any]] = {}
 
-    # Przytnij globalny top do 3 najlepszych po score (dla czytelności)
-    if global_top_entries:
-        global_top_entries.sort(key=lambda e: e["score"], reverse=True)
-        global_top_entries = global_top_entries[:3]
+    def _entry(item: Tuple[int, float, int, str]) -> Dict[str, Any]:
+        ent = entries.get(id(item))
+        if ent is None:
+            score, _, neg_i, mtype = item
+            cand = pool[-neg_i]
+            certainty = _certainty(score, auto_t, border_t)
+            # Bezpiecznik: 'certain' tylko dla normalized_exact (pełna równość po normalizacji)
+            if mtype != "normalized_exact" and certainty == "certain":
+                certainty = "borderline"
+            rel = _relation(author_cf, cand.author_cf)
+            ent = entries[id(item)] = _make_entry(score, certainty, rel, mtype, cand)
+        return ent
 
-    if not best_entry:
-        return _empty_report()
+    best_entry = _entry(best_item)
+    global_top_entries = [_entry(it) for it in top_items]
 
     return {
         "best": best_entry,
@@ -5,13 +5,19 @@
 
 from __future__ import annotations
 import re
+import sys
 import unicodedata
-from typing import Dict, List, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+# API modułu (recent_scan_live.py korzysta z validate_title i is_generic_inquiry)
+__all__ = ["validate_title", "is_generic_inquiry", "cache_clear"]
 
 # ----------------------------- Słowniki / wzorce -----------------------------
 
 # Słowa nie-niosące informacji (po normalizacji, lower-case)
-GENERIC_STOPWORDS: Set[str] = {
+# (sys.intern: te same obiekty co tokeny z _norm_and_tokens → porównanie przez `is`)
+GENERIC_STOPWORDS: FrozenSet[str] = frozenset(map(sys.intern, {
     # ogólne prośby/słowa serwisowe
     "need", "needs", "help", "please", "pls", "plz", "anyone", "someone", "anybody",
     "trying", "try", "find", "finding", "look", "looking", "search", "searching",
@@ -27,137 +33,187 @@ GENERIC_STOPWORDS: Set[str] = {
     "is", "are", "was", "were", "be", "been", "being",
     "my", "your", "their", "his", "her", "our",
     "please,", "please.", "help.", "help,",  # czasem po znakach
-}
+}))
 
 # Słowa „podejrzane” w ultra-krótkich tytułach
-SUSPECT_HINTS: Set[str] = {
+SUSPECT_HINTS: FrozenSet[str] = frozenset(map(sys.intern, {
     "help", "title", "link", "looking", "need", "pls", "please", "find", "finding"
-}
+}))
 
 # Wyrażenia typu „pusta prośba” – jeśli pasuje i brak innych sygnałów → MISSING
-GENERIC_TITLE_PATTERNS = [
+# Wzorce „A … B” mają postać (?m:^)(?>.*?A).*B: grupa atomowa bierze tylko pierwsze A
+# w linii, więc regex nie próbuje od nowa od każdego kolejnego A (liniowo zamiast O(n²)).
+# Dopasowuje dokładnie to samo co \bA\b.*\bB\b.
+GENERIC_TITLE_RAW = (
     # --- prośby ogólne / help ---
-    re.compile(r"\bneed\s+help\b", re.I),
-    re.compile(r"\bhelp\s+me\b", re.I),
-    re.compile(r"\bhelp\b.*\bfind(ing)?\b", re.I),
-    re.compile(r"\bany(one|body)\b.*\bknow\b", re.I),
-    re.compile(r"\bdoes\s+anyone\s+know\s+(its|the)\s+name\b", re.I),
-    re.compile(r"\banyone\s+know\s+(the\s+)?name\b", re.I),
+    r"\bneed\s+help\b",
+    r"\bhelp\s+me\b",
+    r"(?m:^)(?>.*?\bhelp\b).*\bfind(ing)?\b",
+    r"(?m:^)(?>.*?\bany(?:one|body)\b).*\bknow\b",
+    r"\bdoes\s+anyone\s+know\s+(its|the)\s+name\b",
+    r"\banyone\s+know\s+(the\s+)?name\b",
 
     # --- „looking for …” / „find … title/link” ---
-    re.compile(r"\blooking\s+for\b", re.I),
-    re.compile(r"\blooking\s+for\s+(title|link)\b", re.I),
-    re.compile(r"\bfind(ing)?\b.*\btitle\b", re.I),
+    r"\blooking\s+for\b",
+    r"\blooking\s+for\s+(title|link)\b",
+    r"(?m:^)(?>.*?\bfind(?:ing)?\b).*\btitle\b",
 
     # --- „where … watch/find” ---
-    re.compile(r"\bwhere\s+(can\s+)?(i\s+)?watch\b", re.I),
-    re.compile(r"\bwhere\s+to\s+watch\b", re.I),
-    re.compile(r"\bwhere\s+(can\s+)?(i\s+)?find\b", re.I),
+    r"\bwhere\s+(can\s+)?(i\s+)?watch\b",
+    r"\bwhere\s+to\s+watch\b",
+    r"\bwhere\s+(can\s+)?(i\s+)?find\b",
 
     # --- „don’t know / unknown title/name” (różne apostrofy) ---
-    re.compile(r"\b(i\s+)?do(?:n'?|’)?t\s+know\s+(the\s+)?(title|name)\b", re.I),
-    re.compile(r"\b(i\s+)?do\s+not\s+know\s+(the\s+)?(title|name)\b", re.I),
-    re.compile(r"\bunknown\s+(title|name)\b", re.I),
+    r"\b(i\s+)?do(?:n'?|’)?t\s+know\s+(the\s+)?(title|name)\b",
+    r"\b(i\s+)?do\s+not\s+know\s+(the\s+)?(title|name)\b",
+    r"\bunknown\s+(title|name)\b",
 
     # --- „what title …” ---
-    re.compile(r"\bwhat\s+title\b", re.I),
-    re.compile(r"\bwhat\s+is\s+the\s+title\b", re.I),
+    r"\bwhat\s+title\b",
+    r"\bwhat\s+is\s+the\s+title\b",
 
     # --- „no title …” / prośby o tytuł/link ---
-    re.compile(r"\bno\s+title\b", re.I),
-    re.compile(r"\bno\s+title\s+in\s+(video|poster|image|clip)\b", re.I),
-    re.compile(r"\btitle\s+please\b", re.I),
-    re.compile(r"\b(video\s+)?link\s+please\b", re.I),
-    re.compile(r"\b(title|link)\s+(pls|plz|please)\b", re.I),
-    re.compile(r"\b(please\s+)?(share|give|send)\s+(the\s+)?(title|link)\b", re.I),
-]
+    r"\bno\s+title\b",
+    r"\bno\s+title\s+in\s+(video|poster|image|clip)\b",
+    r"\btitle\s+please\b",
+    r"\b(video\s+)?link\s+please\b",
+    r"\b(title|link)\s+(pls|plz|please)\b",
+    r"\b(please\s+)?(share|give|send)\s+(the\s+)?(title|link)\b",
+)
+
+# Wszystkie wzorce w jednej alternacji — jeden search zamiast pętli po ~20 wzorcach.
+# Każdy w (?:...), grupy w środku nie mają znaczenia (sprawdzamy tylko, czy pasuje).
+_GENERIC_UNION = re.compile("|".join(f"(?:{p})" for p in GENERIC_TITLE_RAW), re.I)
+
+# Każdy wzorzec wyżej zawiera dosłownie któreś z tych słów (unknown ⊃ know).
+# Tytuł bez żadnego z nich nie może pasować — wtedy regex w ogóle nie rusza.
+# Dopisując wzorzec, dopisz też jego słowo tutaj.
+_GENERIC_ANCHORS = ("help", "know", "looking", "title", "where", "link")
+# znaki, które re.I utożsamia z i/s, a str.lower() nie
+_ANCHOR_FOLD = str.maketrans({"ı": "i", "İ": "i", "ſ": "s"})
+
+# Limity długości: tytuł na Reddicie ma max 300 znaków — limit Reddita + zapas.
+# Dłuższy tekst (np. wklejony opis) nie jest skanowany/normalizowany w całości.
+_GENERIC_SCAN_CAP = 400
+_NORM_INPUT_CAP = 512
 
 # Flairy, dla których wymagamy faktycznej nazwy/opisu (pełna surowość)
-STRICT_FLAIRS = {"📌 Link Request", "📌 Drama ID", "🔍 Inquiry"}
+STRICT_FLAIRS = frozenset({"📌 Link Request", "📌 Drama ID", "🔍 Inquiry"})
 
 # ----------------------------- Normalizacja / tokeny -----------------------------
 
+# Usuwamy nadmiarową interpunkcję (zachowujemy cyfry/litery/CJK i myślnik w środku słowa)
+_NORM_PUNCT = re.compile(r"[^\w\s\-\,\.\u4e00-\u9fff\u3040-\u30ff]", re.UNICODE)
+# To samo dla ASCII jako tabela str.translate (znaki wybrane przez sam _NORM_PUNCT)
+_NORM_PUNCT_ASCII = str.maketrans({chr(c): " " for c in range(128) if _NORM_PUNCT.match(chr(c))})
+
 def _nfkc(s: str) -> str:
+    # ASCII jest już w NFKC; dla reszty Quick Check (UAX #15) przed pełną normalizacją
+    if s.isascii() or unicodedata.is_normalized("NFKC", s):
+        return s
     return unicodedata.normalize("NFKC", s)
 
 def _normalize_text(s: str) -> str:
-    s = _nfkc(s or "")
-    # Usuwamy nadmiarową interpunkcję (zachowujemy cyfry/litery/CJK i myślnik w środku słowa)
-    s = re.sub(r"[^\w\s\-\,\.\u4e00-\u9fff\u3040-\u30ff]", " ", s, flags=re.UNICODE)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def _tokens(s: str) -> List[str]:
-    if not s:
-        return []
-    return [t for t in s.split() if t]
-
-def _ltoken(t: str) -> str:
-    return t.lower()
-
-def _informative_tokens(tokens: List[str]) -> List[str]:
-    return [t for t in map(_ltoken, tokens) if t not in GENERIC_STOPWORDS and len(t) >= 2]
+    s = (s or "")[:_NORM_INPUT_CAP]
+    if s.isascii():
+        # bez NFKC i bez regexu; split() tnie po tych samych znakach co \s
+        return " ".join(s.translate(_NORM_PUNCT_ASCII).split())
+    # split()/join zamiast \s+ → " " i strip(): ta sama definicja białych znaków
+    return " ".join(_NORM_PUNCT.sub(" ", _nfkc(s)).split())
+
+@lru_cache(maxsize=2048)
+def _norm_and_tokens(title_raw: str) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    (tekst znormalizowany, tokeny, tokeny lower-case) dla surowego tytułu — współdzielone
+    przez _looks_like_generic_placeholder i validate_title, które pracują na tym samym tytule.
+    Lower-case liczone raz tutaj (i internowane jak stopwordy), helpery go nie powtarzają.
+    Krotki, bo wynik siedzi w cache.
+    """
+    s_norm = _normalize_text(title_raw)
+    toks = tuple(s_norm.split())  # split() bez argumentu nie daje pustych tokenów
+    return s_norm, toks, tuple(sys.intern(t.lower()) for t in toks)
 
 # ----------------------------- Heurystyki wykrywania -----------------------------
 
-def _has_strong_signal(tokens: List[str]) -> bool:
+_RE_CJK = re.compile(r"[\u4e00-\u9fff\u3040-\u30ff]")
+_RE_ALNUM_MIX = re.compile(r"[A-Za-z]\d|\d[A-Za-z]")
+_RE_PLEASE_TYPO = re.compile(r"(?:p?l?e?a?se|pls|plz|pleez|llease)")
+_RE_NAME_WORD = re.compile(r"[A-Za-z][A-Za-z']+")
+_RE_QUOTED = re.compile(r"[\"“][^\"“]{3,}?[\"”]")
+
+def _token_is_hyphen_title(tok: str) -> bool:
+    # np. "Stand-in", "Re-born" — myślnik w rdzeniu, nie prefiks/sufiks:
+    # dokładnie jeden myślnik, po obu stronach ≥2 litery ASCII (bez regexu)
+    if tok.count("-") != 1 or not tok.isascii():
+        return False
+    head, _, tail = tok.partition("-")
+    return len(head) >= 2 and len(tail) >= 2 and head.isalpha() and tail.isalpha()
+
+class _TokenStats(NamedTuple):
+    informative: Tuple[str, ...]  # tokeny lower-case ≥2 znaki, bez stopwordów
+    n_long_informative: int     # informative o długości ≥4
+    titlecase_ratio: float      # odsetek tokenów TitleCase
+    has_hyphen_title: bool      # any(_token_is_hyphen_title)
+    has_suspect: bool           # słowo z SUSPECT_HINTS albo "please" z literówką
+    has_strong: bool            # has_id_signal albo ≥2 tokeny informative o długości ≥4
+    has_id_signal: bool         # CJK / 4+ cyfr / litera+cyfra (has_strong bez reguły ≥2 słów)
+
+def _token_stats(tokens: List[str], s_norm: str, tokens_lower: Tuple[str, ...]) -> _TokenStats:
     """
+    Wszystkie cechy tokenów potrzebne heurystykom w jednym przejściu (jedyna
+    implementacja tych reguł — is_generic_inquiry, placeholder i validate_title
+    czytają wynik przez _title_stats).
     Silne sygnały, że tytuł niesie konkretną informację:
-    - znaki CJK (często prawdziwa nazwa),
+    - znaki CJK (często prawdziwa nazwa) — szukane w `s_norm`, bez sklejania tokenów,
     - numer identyfikacyjny / rok / 4+ cyfry (np. 11735),
     - mix liter i cyfr (np. s02e03, ep10),
     - co najmniej 2 sensowne tokeny (>=4 znaki) po odcięciu stopwordów.
     """
-    s = " ".join(tokens)
-    if re.search(r"[\u4e00-\u9fff\u3040-\u30ff]", s):
-        return True
-    if any(re.fullmatch(r"\d{4,}", t) for t in tokens):
-        return True
-    if any(re.search(r"[A-Za-z]\d|\d[A-Za-z]", t) for t in tokens):
-        return True
-    informative = _informative_tokens(tokens)
-    if sum(1 for t in informative if len(t) >= 4) >= 2:
-        return True
-    return False
-
-def _token_is_hyphen_title(tok: str) -> bool:
-    # np. "Stand-in", "Re-born" — myślnik w rdzeniu, nie prefiks/sufiks
-    return bool(re.fullmatch(r"[A-Za-z]{2,}\-[A-Za-z]{2,}", tok))
-
-def _titlecase_ratio(tokens: List[str]) -> float:
-    if not tokens:
-        return 0.0
-    tc = 0
-    for t in tokens:
+    informative: List[str] = []
+    n_long = tc = 0
+    hyphen = suspect = digits = False
+    for t, low in zip(tokens, tokens_lower):
+        # długość najpierw: 1-znakowe tokeny („a”, „I”) odpadają bez hashowania
+        if len(low) >= 2 and low not in GENERIC_STOPWORDS:
+            informative.append(low)
+            if len(low) >= 4:
+                n_long += 1
+        # (nie t[0].isupper(): litery bez wielkości, np. CJK, liczą się tu jako TitleCase)
         if len(t) >= 2 and t[0].isalpha() and t[0].upper() == t[0]:
             tc += 1
-    return tc / max(1, len(tokens))
-
-def _has_suspect_word(tokens: List[str]) -> bool:
-    tl = [t.lower() for t in tokens]
-    if any(t in SUSPECT_HINTS for t in tl):
-        return True
-    # "please" z literówkami: llease, pleez, pls, plz, itp.
-    for t in tl:
-        if re.fullmatch(r"(?:p?l?e?a?se|pls|plz|pleez|llease)", t):
-            return True
-    return False
+        if not hyphen and "-" in t and _token_is_hyphen_title(t):
+            hyphen = True
+        # "please" z literówkami: llease, pleez, pls, plz, itp.
+        if not suspect and (low in SUSPECT_HINTS or _RE_PLEASE_TYPO.fullmatch(low)):
+            suspect = True
+        # 4+ cyfr: isdecimal() to dokładnie \d (kategoria Nd), bez regexu per token.
+        # Czyste słowa (isalpha — same litery, więc zero cyfr) nie mogą dać ani jednego,
+        # ani mixu litera+cyfra: regex dostają tylko tokeny z cyfrą/myślnikiem/kropką.
+        if not digits and not t.isalpha() and ((len(t) >= 4 and t.isdecimal()) or _RE_ALNUM_MIX.search(t)):
+            digits = True
+    id_signal = digits or bool(_RE_CJK.search(s_norm))
+    ratio = tc / len(tokens) if tokens else 0.0
+    return _TokenStats(tuple(informative), n_long, ratio, hyphen, suspect, id_signal or n_long >= 2, id_signal)
+
+@lru_cache(maxsize=2048)
+def _title_stats(title_raw: str) -> _TokenStats:
+    # _token_stats dla surowego tytułu — liczone raz, a czytane i przez
+    # _looks_like_generic_placeholder, i przez validate_title
+    s_norm, toks, toks_low = _norm_and_tokens(title_raw)
+    return _token_stats(toks, s_norm, toks_low)
 
 def _looks_like_generic_request(s_norm: str) -> bool:
-    return any(p.search(s_norm) for p in GENERIC_TITLE_PATTERNS)
-
-SUSPECT_CORE = {"title","link","video","name","help","please","pls","plz","anyone","anybody","know","share","find","finding","where"}
-
-def _mostly_suspect(tokens: list[str]) -> bool:
-    tl = [t.lower() for t in tokens]
-    if not tl:
+    low = s_norm[:_GENERIC_SCAN_CAP].translate(_ANCHOR_FOLD).lower()
+    if not any(a in low for a in _GENERIC_ANCHORS):
         return False
-    sus = sum(1 for t in tl if t in SUSPECT_CORE)
-    # „krótki” nagłówek (≤6 słów) i przynajmniej 2-3 „podejrzane” słowa → MISSING
-    return (len(tl) <= 6 and sus >= 2)
+    # endpos: regex nie wychodzi poza limit, niezależnie od długości wejścia
+    return _GENERIC_UNION.search(s_norm, 0, _GENERIC_SCAN_CAP) is not None
+
+SUSPECT_CORE: FrozenSet[str] = frozenset(map(sys.intern, {"title","link","video","name","help","please","pls","plz","anyone","anybody","know","share","find","finding","where"}))
 
 # ----------------------------- Inquiry: generica -----------------------------
 
+@lru_cache(maxsize=4096)
 def is_generic_inquiry(title: str) -> bool:
     """
     True, jeśli tytuł wygląda na „pustą prośbę” (help/title/link/looking for...),
@@ -168,8 +224,7 @@ def is_generic_inquiry(title: str) -> bool:
     if not title_raw:
         return True  # pusty = ewidentnie zły
 
-    title_norm = _normalize_text(title_raw)
-    toks = _tokens(title_norm)
+    title_norm, toks, _ = _norm_and_tokens(title_raw)
 
     # Jeżeli w ogóle nie ma tokenów po normalizacji, traktujemy jako puste
     if not toks:
@@ -177,7 +232,7 @@ def is_generic_inquiry(title: str) -> bool:
 
     # Jeśli w tytule jest coś, co wygląda na imię/nazwisko aktora lub nazwę dramy,
     # nie traktujemy tego jako generic inquiry (np. "Liu Xiao Xu", "Zhao Lusi").
-    raw_tokens = re.findall(r"[A-Za-z][A-Za-z']+", title_raw)
+    raw_tokens = _RE_NAME_WORD.findall(title_raw)
     name_like: List[str] = []
     for t in raw_tokens:
         lower = t.lower()
@@ -197,7 +252,8 @@ def is_generic_inquiry(title: str) -> bool:
         return False
         
     # Jeśli są „silne sygnały”, nie kwalifikujemy jako 'generic inquiry'
-    if _has_strong_signal(toks):
+    st = _title_stats(title_raw)
+    if st.has_strong:
         return False
 
     # Typowe puste wzorce (need help / help me / looking for / find title / title+link)
@@ -205,7 +261,7 @@ def is_generic_inquiry(title: str) -> bool:
         return True
 
     # Ultra-krótkie tytuły zawierające słowa podejrzane (help/title/link/please/looking…)
-    if _has_suspect_word(toks):
+    if st.has_suspect:
         # brak silnych sygnałów + podejrzane słowo → generica
         return True
 
@@ -222,16 +278,17 @@ def _looks_like_generic_placeholder(title: str) -> bool:
         return True
 
     t_raw = title.strip()
-    t_norm = _normalize_text(t_raw)
-    toks = _tokens(t_norm)
+    t_norm, toks, _ = _norm_and_tokens(t_raw)
 
     # ----- mocne wyjątki (NIE oznaczamy jako generic) -----
     if not toks:
         return True  # puste po normalizacji
-    if _has_strong_signal(toks):
+    # tytuł w cudzysłowie (np. "Love Beyond Fate") — jeden regex, więc przed
+    # statystykami tokenów (pętla po tokenach); oba wyjątki dają ten sam wynik
+    if _RE_QUOTED.search(t_raw):
         return False
-    # tytuł w cudzysłowie (np. "Love Beyond Fate")
-    if re.search(r"[\"“][^\"“]{3,}?[\"”]", t_raw):
+    st = _title_stats(t_raw)
+    if st.has_strong:
         return False
 
     # ----- klasyczne puste wzorce -----
@@ -239,14 +296,38 @@ def _looks_like_generic_placeholder(title: str) -> bool:
         return True
 
     # bardzo mało treści informacyjnej (≤2 tokeny sensowne) + podejrzane słowa
-    informative = _informative_tokens(toks)
-    if len(informative) <= 2 and _has_suspect_word(toks):
+    if len(st.informative) <= 2 and st.has_suspect:
         return True
 
     return False
 
 # ----------------------------- Walidator główny -----------------------------
 
+# Wszystkie możliwe wyniki _validate_title_cached jako gotowe dicty (wzorce).
+# Na zewnątrz idzie zawsze kopia: wywołujący może dopisywać klucze do wyniku
+# bez psucia kolejnych wywołań (MappingProxyType odpada — wynik trafia do json.dumps).
+_RESULTS: Dict[Tuple[str, str], Dict[str, str]] = {
+    (status, reason): {"status": status, "reason": reason}
+    for status, reason in (
+        ("MISSING", "empty_title"),
+        ("MISSING", "generic_placeholder"),
+        ("MISSING", "empty_after_norm"),
+        ("MISSING", "generic_title"),
+        ("AMBIGUOUS", "generic_phrase"),
+        ("AMBIGUOUS", "short_but_clean"),
+        ("AMBIGUOUS", "uninformative"),
+        ("OK", "looks_like_title"),
+        ("OK", "title_candidate"),
+    )
+}
+
+def cache_clear() -> None:
+    """Czyści cache wyników walidacji (np. po zmianie wzorców w locie)."""
+    _validate_title_cached.cache_clear()
+    is_generic_inquiry.cache_clear()
+    _title_stats.cache_clear()
+    _norm_and_tokens.cache_clear()
+
 def validate_title(title: str, flair: str = "", config: Dict = None) -> Dict[str, str]:
     """
     Zwraca dict: {"status": "OK|AMBIGUOUS|MISSING", "reason": "<krótki_powód>"}.
@@ -256,71 +337,70 @@ def validate_title(title: str, flair: str = "", config: Dict = None) -> Dict[str
       - Jeśli tytuł jest bardzo krótki, ale „czysty” (bez podejrzanych słów) i ma ≥1 sensowny token (≥4 litery),
         to AMBIGUOUS (trafi do MOD_QUEUE), nie MISSING.
       - „Help/link/title/please…” nadal klasyfikują jako MISSING, o ile brak silnych sygnałów.
+    Każde wywołanie zwraca nowy dict (można go modyfikować).
     """
+    # Te same tytuły wracają w kolejnych przebiegach bota — wynik z cache,
+    # zwracany jako świeża kopia wzorca z _RESULTS
+    return dict(_RESULTS[_validate_title_cached(title or "", flair or "")])
+
+@lru_cache(maxsize=4096)
+def _validate_title_cached(title: str, flair: str) -> Tuple[str, str]:
     flair = (flair or "").strip()
     title_raw = (title or "").strip()
 
+    # Pusty tytuł: od razu, bez normalizacji i regexów (dla ścisłych flairów
+    # _looks_like_generic_placeholder i tak dałby generic_placeholder)
+    if not title_raw:
+        return "MISSING", ("generic_placeholder" if flair in STRICT_FLAIRS else "empty_title")
+
     # 📌 Link Request → najpierw odsień „puste/generic” tytuły
     if flair in STRICT_FLAIRS:
         if _looks_like_generic_placeholder(title_raw):
-            return {"status": "MISSING", "reason": "generic_placeholder"}
+            return "MISSING", "generic_placeholder"
 
-    # Puste pozycje łapiemy zawsze
-    if not title_raw:
-        return {"status": "MISSING", "reason": "empty_title"}
-
-    title_norm = _normalize_text(title_raw)
-    toks = _tokens(title_norm)
+    title_norm, toks, _ = _norm_and_tokens(title_raw)
     if not toks:
-        return {"status": "MISSING", "reason": "empty_after_norm"}
-
-    informative = _informative_tokens(toks)
+        return "MISSING", "empty_after_norm"
 
     # --- Bezpiecznik kontekstowy dla fraz-generyków ---
-    has_generic_phrase = any(p.search(title_norm) for p in GENERIC_TITLE_PATTERNS)
+    has_generic_phrase = _looks_like_generic_request(title_norm)
 
     if has_generic_phrase:
-        content = _content_tokens(_tokens((title or "").strip()))
-        # Jeśli nagłówek jest dłuższy (więcej niż 6 słów) i
-        # widać co najmniej 2 sensowne tokeny LUB jest ewidentne nazwisko,
-        # nie traktuj jako MISSING – zdegraduj do AMBIGUOUS (modqueue).
-        if len(toks) > 6 and (len(content) >= 1 or _has_proper_name(_tokens(title))):
-            return {"status": "AMBIGUOUS", "reason": "generic_with_context"}
-        # W przeciwnym razie klasyczny MISSING
-        return {"status": "MISSING", "reason": "generic_placeholder"}
-
-    # Sztywne „puste prośby” dla ścisłych flairów, jeśli brak silnych sygnałów
-    if flair in STRICT_FLAIRS:
-        if _looks_like_generic_request(title_norm) and not _has_strong_signal(toks):
-            return {"status": "MISSING", "reason": "generic_title"}
+        # Fraza-generyk, której nie odsiał placeholder (ścisłe flairy: jest silny sygnał
+        # albo cudzysłów; pozostałe flairy: zawsze) → modqueue, nie MISSING/AUTO_REMOVE.
+        # Tyle samo, ile dawał skaner: ta gałąź rzucała NameError → validator_error → AMBIGUOUS.
+        # Ewentualne auto-usuwanie takich tytułów to osobna zmiana zasad moderacji.
+        return "AMBIGUOUS", "generic_phrase"
 
     # Heurystyki ratunkowe dla krótkich tytułów
     words_cnt = len(toks)
-    has_hyphen_title = any(_token_is_hyphen_title(t) for t in toks)
-    titlecase_ratio = _titlecase_ratio(toks)
-    has_suspect = _has_suspect_word(toks)
-    has_strong = _has_strong_signal(toks)
-    long_informative = [t for t in informative if len(t) >= 4]
+    st = _title_stats(title_raw)  # dla ścisłych flairów zwykle już policzone w placeholderze
+    informative = st.informative
+    has_hyphen_title = st.has_hyphen_title
+    titlecase_ratio = st.titlecase_ratio
+    has_suspect = st.has_suspect
+    has_strong = st.has_strong
+    n_long_informative = st.n_long_informative
 
     if flair in STRICT_FLAIRS:
         # 1) Wygląda jak tytuł → OK
         #    - token z myślnikiem (stand-in)
         #    - ≤3 słowa, ≥1 sensowny token (≥4 litery) i >=50% TitleCase
-        if has_hyphen_title or (words_cnt <= 3 and len(long_informative) >= 1 and titlecase_ratio >= 0.5):
-            return {"status": "OK", "reason": "looks_like_title"}
+        if has_hyphen_title or (words_cnt <= 3 and n_long_informative >= 1 and titlecase_ratio >= 0.5):
+            return "OK", "looks_like_title"
 
         # 2) Krótkie, ale czyste → AMBIGUOUS (do MOD_QUEUE), o ile brak podejrzanych słów
         if not has_strong and len(informative) < 2:
-            if not has_suspect and len(long_informative) >= 1:
-                return {"status": "AMBIGUOUS", "reason": "short_but_clean"}
+            if not has_suspect and n_long_informative >= 1:
+                return "AMBIGUOUS", "short_but_clean"
             # 3) Jeśli nadal brak mocnych sygnałów i tytuł jest „pusty” → MISSING
-            return {"status": "MISSING", "reason": "generic_title"}
+            return "MISSING", "generic_title"
 
         # 4) W pozostałych przypadkach — OK (bo mamy już dość sygnałów)
-        return {"status": "OK", "reason": "title_candidate"}
+        return "OK", "title_candidate"
 
     else:
         # Łagodniejsze zasady dla innych flairów (np. Inquiry)
         if len(informative) == 0 and not has_strong:
-            return {"status": "AMBIGUOUS", "reason": "uninformative"}
-        return {"status": "OK", "reason": "title_candidate"}
+            return "AMBIGUOUS", "uninformative"
+        return "OK", "title_candidate"
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+tv_smoketest.py — quick I/O smoketests for title_validator.validate_title()
+
+Scenarios covered:
+  1) Empty requests caught by the placeholder check
+     on strict flairs ("Need help finding title or link") -> MISSING
+  2) Generic phrase the placeholder check lets through
+     (request words, quoted title, CJK, year, s02e03)    -> AMBIGUOUS (modqueue)
+  3) Short real titles ("The Stand-in")                  -> OK
+
+Usage:
+  python tv_smoketest.py
+  python tv_smoketest.py --verbose
+
+Exit codes:
+  0 = all cases passed
+  1 = any failure (mismatch or exception)
+"""
+
+from __future__ import annotations
+import argparse
+import sys
+from typing import List, Tuple
+
+try:
+    import title_validator
+except Exception as e:
+    print(f"[FATAL] Cannot import title_validator: {e}", file=sys.stderr)
+    sys.exit(1)
+
+
+LINK_REQUEST = "📌 Link Request"
+ACTOR_INQUIRY = "🎭 Actor Inquiry"
+
+# (title, flair, expected status)
+CASES: List[Tuple[str, str, str]] = [
+    # 1) puste prośby (ścisły flair, odsiane przez placeholder)
+    ("Need help finding title or link", LINK_REQUEST, "MISSING"),
+    ("help me find this", LINK_REQUEST, "MISSING"),
+    ("looking for title", LINK_REQUEST, "MISSING"),
+    # 2) fraza-generyk, której placeholder nie odsiał → modqueue, nie AUTO_REMOVE
+    ("looking for title", ACTOR_INQUIRY, "AMBIGUOUS"),
+    ("Does anyone know its name?", LINK_REQUEST, "AMBIGUOUS"),
+    ("Where can I watch this?", LINK_REQUEST, "AMBIGUOUS"),
+    ("Where can I watch this?", ACTOR_INQUIRY, "AMBIGUOUS"),
+    ("Does anyone know where?", LINK_REQUEST, "AMBIGUOUS"),
+    ("Does anyone know where to watch?", LINK_REQUEST, "AMBIGUOUS"),
+    ("share title Zhao", LINK_REQUEST, "AMBIGUOUS"),
+    ("I dont know the title", LINK_REQUEST, "AMBIGUOUS"),
+    ("Looking for Love Beyond Fate", LINK_REQUEST, "AMBIGUOUS"),
+    ("Looking for Love Beyond Fate", ACTOR_INQUIRY, "AMBIGUOUS"),
+    ('Need help finding "Secret Wife"', LINK_REQUEST, "AMBIGUOUS"),
+    ('Need help finding "Secret Wife"', ACTOR_INQUIRY, "AMBIGUOUS"),
+    ("help me find 霸道总裁", LINK_REQUEST, "AMBIGUOUS"),
+    ("help me find 霸道总裁", ACTOR_INQUIRY, "AMBIGUOUS"),
+    ("Looking for s02e03 of Hidden Heiress", LINK_REQUEST, "AMBIGUOUS"),
+    ("Looking for s02e03 of Hidden Heiress", ACTOR_INQUIRY, "AMBIGUOUS"),
+    ("Looking for this 2024 drama", LINK_REQUEST, "AMBIGUOUS"),
+    ("Looking for this 2024 drama", ACTOR_INQUIRY, "AMBIGUOUS"),
+    # 3) krótkie, prawdziwe tytuły
+    ("The Stand-in", LINK_REQUEST, "OK"),
+    ("Contract Marriage", LINK_REQUEST, "OK"),
+]
+
+
+def run_case(title: str, flair: str, expected: str, verbose: bool) -> bool:
+    label = f"{flair} | {title}"
+    try:
+        rep = title_validator.validate_title(title, flair, None)
+    except Exception as e:
+        print(f"[{label}] EXCEPTION: {e}", file=sys.stderr)
+        return False
+
+    got = (rep or {}).get("status")
+    ok = got == expected
+    if verbose or not ok:
+        status = "PASS" if ok else "FAIL"
+        print(f"[{label}] {status} -> got {got} ({(rep or {}).get('reason')}) | expected={expected}")
+    return ok
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--verbose", action="store_true", help="Print every case, not only failures.")
+    args = ap.parse_args()
+
+    any_fail = False
+    for title, flair, expected in CASES:
+        if not run_case(title, flair, expected, args.verbose):
+            any_fail = True
+
+    if any_fail:
+        print("[RESULT] FAIL", file=sys.stderr)
+        return 1
+
+    print(f"[RESULT] PASS ({len(CASES)} cases)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())